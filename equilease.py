@@ -3,20 +3,22 @@
 # ========================================
 
 import streamlit as st
-import pandas as pd
 import json
+import re
+import threading
 import uuid
-import numpy as np
+import importlib.util
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
+from functools import lru_cache
 import os
 
-# Optional plotly import
-try:
-    import plotly.express as px
-    import plotly.graph_objects as go
-    PLOTLY_AVAILABLE = True
-except ImportError:
-    PLOTLY_AVAILABLE = False
+# pandas, numpy and plotly are imported inside the functions that need them,
+# so pages that never build a DataFrame or chart skip their import cost
+
+# Optional plotly dependency
+PLOTLY_AVAILABLE = importlib.util.find_spec('plotly') is not None
+if not PLOTLY_AVAILABLE:
     st.warning("Plotly not installed. Charts will be disabled. Install with: pip install plotly")
 
 # Page configuration
@@ -32,183 +34,468 @@ st.set_page_config(
 # ========================================
 
 DATA_DIR = 'data'
-DEALS_FILE = os.path.join(DATA_DIR, 'deals.json')
+DEALS_FILE = os.path.join(DATA_DIR, 'deals.jsonl')
+LEGACY_DEALS_FILE = os.path.join(DATA_DIR, 'deals.json')
+
+# Deals live in an append-only JSON Lines log: one line per new deal plus a
+# small delta line per status change. Once enough deltas pile up the log is
+# compacted back to one line per deal.
+COMPACT_AFTER = 50
 
 def initialize_database():
     """Initialize the database directory and files"""
     if not os.path.exists(DATA_DIR):
         os.makedirs(DATA_DIR)
     
+    # Migrate the old single-document store into a missing or empty log,
+    # then move it aside so it is never imported twice
+    log_is_empty = not os.path.exists(DEALS_FILE) or os.path.getsize(DEALS_FILE) == 0
+    if log_is_empty and os.path.exists(LEGACY_DEALS_FILE):
+        legacy_deals = []
+        try:
+            with open(LEGACY_DEALS_FILE, 'r') as f:
+                legacy_deals = json.load(f)
+        except json.JSONDecodeError:
+            pass
+        if legacy_deals:
+            save_deals(legacy_deals)
+            os.replace(LEGACY_DEALS_FILE, LEGACY_DEALS_FILE + '.migrated')
+    
     if not os.path.exists(DEALS_FILE):
-        with open(DEALS_FILE, 'w') as f:
-            json.dump([], f)
+        save_deals([])
 
-def load_deals():
-    """Load all deals from JSON file"""
+@st.cache_resource(show_spinner=False)
+def _database_ready():
+    """Initialize the database once per process rather than on every rerun"""
+    initialize_database()
+    return True
+
+@st.cache_resource(show_spinner=False)
+def _deal_store():
+    """Process-wide deal cache, shared across reruns and sessions"""
+    # Sessions run on separate threads, so reads and writes of the shared
+    # cache and the log go through one lock
+    return {
+        'signature': None, 'deals': None, 'by_id': {}, 'by_status': {}, 'version': 0, 'deltas': 0,
+        'lock': threading.RLock()
+    }
+
+def _log_signature():
+    """Cheap fingerprint of the deals log used to detect outside changes"""
     try:
-        with open(DEALS_FILE, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return []
+        stat = os.stat(DEALS_FILE)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+def _index_by_status(deals):
+    """Map each status to the set of list positions holding it"""
+    by_status = {}
+    for pos, deal in enumerate(deals):
+        by_status.setdefault(deal.get('status'), set()).add(pos)
+    return by_status
+
+def _encode_record(record):
+    """Serialize one deal or delta as a compact JSON line"""
+    return json.dumps(record, separators=(',', ':'), ensure_ascii=False, default=str) + '\n'
 
-def save_deals(deals):
-    """Save deals to JSON file"""
-    with open(DEALS_FILE, 'w') as f:
-        json.dump(deals, f, indent=2, default=str)
+def load_deals():
+    """Load all deals, replaying the JSON Lines log only when it changed"""
+    store = _deal_store()
+    signature = _log_signature()
+    deals = store['deals']
+    if deals is not None and store['signature'] == signature:
+        return deals
+    
+    with store['lock']:
+        return _replay_log(store)
+
+def _replay_log(store):
+    """Rebuild the cached deals and indexes from the log"""
+    signature = _log_signature()
+    if store['deals'] is not None and store['signature'] == signature:
+        return store['deals']  # another session replayed it while we waited
+    
+    deals = []
+    by_id = {}
+    deltas = 0
+    try:
+        # One unbuffered read of the whole log; json.loads decodes UTF-8 bytes itself
+        with open(DEALS_FILE, 'rb', buffering=0) as f:
+            data = f.read()
+    except FileNotFoundError:
+        data = b''
+    
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue  # torn trailing write
+        
+        if record.pop('op', None) == 'status':
+            deltas += 1
+            pos = by_id.get(record['id'])
+            if pos is not None:
+                deals[pos].update(record)
+        else:
+            by_id[record.get('id')] = len(deals)
+            deals.append(record)
+    
+    store.update(
+        signature=signature, deals=deals, by_id=by_id,
+        by_status=_index_by_status(deals), deltas=deltas
+    )
+    store['version'] += 1
+    return deals
+
+def save_deals(deals, compact=False):
+    """Atomically rewrite the log with one line per deal"""
+    store = _deal_store()
+    with store['lock']:
+        tmp_file = DEALS_FILE + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            for deal in deals:
+                f.write(_encode_record(deal))
+        
+        # A compaction only folds what this process has loaded. If the log
+        # changed since, another process appended records the list lacks,
+        # so keep the log and leave the compaction to a later update
+        if compact and _log_signature() != store['signature']:
+            os.remove(tmp_file)
+            return
+        os.replace(tmp_file, DEALS_FILE)
+        
+        by_id = {deal.get('id'): pos for pos, deal in enumerate(deals)}
+        store.update(
+            signature=_log_signature(), deals=deals, by_id=by_id,
+            by_status=_index_by_status(deals), deltas=0
+        )
+        store['version'] += 1
+
+def _append_record(record):
+    """Append a single record to the deals log"""
+    data = _encode_record(record).encode('utf-8')
+    store = _deal_store()
+    before = _log_signature()
+    # One write() on an O_APPEND descriptor lands the whole line at the end
+    # of the file, so appends from other processes cannot split it
+    fd = os.open(DEALS_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    after = _log_signature()
+    
+    # The cache only matches the log if it did before and our line is the
+    # sole addition; otherwise another process wrote too, so drop the cache
+    # and let the next read replay the log
+    before_size = before[1] if before else 0
+    if before == store['signature'] and after is not None and after[1] == before_size + len(data):
+        store['signature'] = after
+    else:
+        store['deals'] = None
 
-def save_deal(business_data, deal_terms, proposal):
+def save_deal(business_data, deal_terms, proposal, now=None):
     """Save a new deal to the database"""
+    now_iso = (now or datetime.now()).isoformat()
+    
+    deal_record = business_data.copy()
+    deal_record.update(deal_terms)
+    deal_record['proposal'] = proposal
+    deal_record['created_at'] = now_iso
+    deal_record['updated_at'] = now_iso
+    
+    store = _deal_store()
+    with store['lock']:
+        deals = load_deals()
+        store['by_id'][deal_record.get('id')] = len(deals)
+        store['by_status'].setdefault(deal_record.get('status'), set()).add(len(deals))
+        deals.append(deal_record)
+        _append_record(deal_record)
+        # Readers don't take the lock, so publish the new version only
+        # once the change is in place
+        store['version'] += 1
+    
+    return deal_record
+
+def get_deals(status=None, since=None, limit=None):
+    """Get deals, optionally filtered by status, creation date and count"""
     deals = load_deals()
+    if status is None and since is None and limit is None:
+        return deals  # the shared cache itself; callers must not mutate it
     
-    deal_record = {
-        **business_data,
-        **deal_terms,
-        'proposal': proposal,
-        'created_at': datetime.now().isoformat(),
-        'updated_at': datetime.now().isoformat()
-    }
+    if status is not None:
+        positions = sorted(_deal_store()['by_status'].get(status, ()))
+        matches = [deals[pos] for pos in positions]
+    else:
+        matches = list(deals)
     
-    deals.append(deal_record)
-    save_deals(deals)
+    if since is not None:
+        since_iso = since.isoformat() if isinstance(since, datetime) else since
+        matches = [deal for deal in matches if deal.get('created_at', '') >= since_iso]
     
-    return deal_record
+    # Keep the most recent matches
+    if limit is not None:
+        matches = matches[-limit:] if limit > 0 else []
+    
+    return matches
 
-def get_deals():
-    """Get all deals"""
-    return load_deals()
+def deal_counts():
+    """Total and pending deal counts, read from the store's indexes"""
+    deals = load_deals()
+    if not deals:
+        return 0, 0
+    return len(deals), len(_deal_store()['by_status'].get('pending', ()))
+
+# Compact dtypes for the analytics frame. Integer columns get the smallest
+# width that fits the data (space_size alone can exceed int16).
+_DF_FLOAT32_COLUMNS = ('risk_score', 'upfront_rent_percent', 'equity_percent', 'revenue_share_percent')
+_DF_INTEGER_COLUMNS = ('team_size', 'runway_months', 'space_size', 'revenue_share_years')
+_DF_CATEGORY_COLUMNS = ('status', 'business_type', 'industry', 'founder_experience')
+_DF_DATETIME_COLUMNS = ('timestamp', 'created_at', 'updated_at', 'approved_at', 'rejected_at')
+
+# Optional fields the deal cards read as attributes, added with these
+# values when no deal has them
+_DF_COLUMN_DEFAULTS = {
+    'industry': 'N/A', 'risk_score': 50, 'upfront_rent_percent': 30, 'monthly_rent': 0,
+    'equity_percent': 5, 'revenue_share_percent': 3, 'funding_raised': 0, 'burn_rate': 0,
+    'runway_months': 0, 'has_revenue': False
+}
+
+# Risk bands shared by cards, filters and charts: < 40 Low, < 70 Medium, else High
+_RISK_CUTS = (40, 70)
+_RISK_LEVELS = ('Low', 'Medium', 'High')
+_RISK_EMOJI = {'Low': '🟢', 'Medium': '🟡', 'High': '🔴'}
+_RISK_RANGE_LABELS = {'Low': 'Low (<40)', 'Medium': 'Medium (40-69)', 'High': 'High (70+)'}
+
+def risk_style(risk_score):
+    """Emoji and level for a single risk score"""
+    level = _RISK_LEVELS[bisect_right(_RISK_CUTS, risk_score)]
+    return _RISK_EMOJI[level], level
+
+def _build_deals_df(deals):
+    """Build the typed analytics DataFrame for a list of deals"""
+    import pandas as pd
+    
+    df = pd.DataFrame(deals)
+    for column, default in _DF_COLUMN_DEFAULTS.items():
+        if column not in df.columns:
+            df[column] = default
+    for column in _DF_FLOAT32_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype('float32')
+    for column in _DF_INTEGER_COLUMNS:
+        if column in df.columns:
+            df[column] = pd.to_numeric(df[column], downcast='integer')
+    for column in _DF_CATEGORY_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+    for column in _DF_DATETIME_COLUMNS:
+        if column in df.columns:
+            df[column] = pd.to_datetime(df[column], format='ISO8601', cache=True, errors='coerce')
+    
+    # Bucket risk once here instead of per row in every view; a missing
+    # score counts as 50, the same default the deal cards use
+    if 'risk_score' in df.columns:
+        df['risk_bucket'] = pd.cut(
+            df['risk_score'].fillna(50),
+            bins=[float('-inf'), *_RISK_CUTS, float('inf')],
+            right=False,
+            labels=_RISK_LEVELS
+        )
+        df['risk_emoji'] = df['risk_bucket'].map(_RISK_EMOJI)
+    return df
+
+def deals_version():
+    """Counter bumped on every change to the deals; use it as a cache key"""
+    load_deals()
+    return _deal_store()['version']
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _deals_df(version):
+    # cache_resource hands back the frame itself rather than a pickled copy
+    return _build_deals_df(load_deals())
+
+def get_deals_df():
+    """Get all deals as a DataFrame, rebuilt only after the deals change"""
+    return _deals_df(deals_version())
 
 def get_deal_by_id(deal_id):
     """Get a specific deal by ID"""
     deals = load_deals()
-    for deal in deals:
-        if deal.get('id') == deal_id:
-            return deal
-    return None
+    pos = _deal_store()['by_id'].get(deal_id)
+    return deals[pos] if pos is not None else None
 
 def update_deal_status(deal_id, new_status):
     """Update the status of a deal"""
-    deals = load_deals()
-    
-    for deal in deals:
-        if deal.get('id') == deal_id:
-            deal['status'] = new_status
-            deal['updated_at'] = datetime.now().isoformat()
-            if new_status == 'approved':
-                deal['approved_at'] = datetime.now().isoformat()
-            elif new_status == 'rejected':
-                deal['rejected_at'] = datetime.now().isoformat()
-            break
-    
-    save_deals(deals)
+    now_iso = datetime.now().isoformat()
+    delta = {
+        'status': new_status,
+        'updated_at': now_iso
+    }
+    if new_status == 'approved':
+        delta['approved_at'] = now_iso
+    elif new_status == 'rejected':
+        delta['rejected_at'] = now_iso
+    
+    store = _deal_store()
+    with store['lock']:
+        deals = load_deals()
+        pos = store['by_id'].get(deal_id)
+        if pos is None:
+            return
+        
+        store['by_status'].get(deals[pos].get('status'), set()).discard(pos)
+        store['by_status'].setdefault(new_status, set()).add(pos)
+        deals[pos].update(delta)
+        
+        _append_record({'op': 'status', 'id': deal_id, **delta})
+        store['deltas'] += 1
+        store['version'] += 1
+        if store['deltas'] >= COMPACT_AFTER:
+            save_deals(deals, compact=True)
 
 # ========================================
 # AI LOGIC FUNCTIONS
 # ========================================
 
+_BUSINESS_TYPE_RISK = {
+    'SaaS Startup': -10,
+    'E-commerce': -5,
+    'Professional Services': -8,
+    'Manufacturing': 0,
+    'Restaurant': +25,
+    'Retail Store': +15,
+    'Franchise': -5,
+    'Other': +10
+}
+
+_INDUSTRY_RISK = {
+    'Technology': -8,
+    'Healthcare': -5,
+    'Finance': -3,
+    'Education': 0,
+    'Food & Beverage': +20,
+    'Retail': +12,
+    'Real Estate': +5,
+    'Other': +8
+}
+
+_EXPERIENCE_IMPACT = {
+    'Previous successful exit': -20,
+    'Serial entrepreneur': -15,
+    'Industry veteran (10+ years)': -12,
+    'First-time founder': +10
+}
+
+# Score bands as sorted edges plus one delta per bucket: a value lands in the
+# bucket counting how many edges it strictly exceeds. Headcount, runway and
+# space are whole numbers, so a "< n" band edge is stored as n - 1.
+_REVENUE_THRESHOLDS = (1000, 5000, 10000)
+_REVENUE_DELTAS = (+10, -5, -10, -15)
+
+_TEAM_THRESHOLDS = (1, 5, 10, 20)
+_TEAM_DELTAS = (+15, 0, -5, -8, -10)
+
+_FUNDING_THRESHOLDS = (100000, 500000, 1000000)
+_FUNDING_DELTAS = (-5, -10, -15, -20)
+
+_RUNWAY_THRESHOLDS = (5, 12, 18)
+_RUNWAY_DELTAS = (+15, 0, -5, -10)
+
+_SPACE_THRESHOLDS = (499, 3000, 5000)
+_SPACE_DELTAS = (-3, 0, +5, +8)
+
 def calculate_risk_score(business_data):
     """Calculate AI-based risk score for business"""
+    get = business_data.get
     base_score = 50
     
     # Business type risk adjustment
-    business_type_risk = {
-        'SaaS Startup': -10,
-        'E-commerce': -5,
-        'Professional Services': -8,
-        'Manufacturing': 0,
-        'Restaurant': +25,
-        'Retail Store': +15,
-        'Franchise': -5,
-        'Other': +10
-    }
-    base_score += business_type_risk.get(business_data.get('business_type', 'Other'), 0)
+    base_score += _BUSINESS_TYPE_RISK.get(get('business_type', 'Other'), 0)
     
     # Industry risk factors
-    industry_risk = {
-        'Technology': -8,
-        'Healthcare': -5,
-        'Finance': -3,
-        'Education': 0,
-        'Food & Beverage': +20,
-        'Retail': +12,
-        'Real Estate': +5,
-        'Other': +8
-    }
-    base_score += industry_risk.get(business_data.get('industry', 'Other'), 0)
+    base_score += _INDUSTRY_RISK.get(get('industry', 'Other'), 0)
     
     # Revenue indicators
-    current_revenue = business_data.get('current_revenue', 0)
-    projected_12m = business_data.get('projected_revenue_12m', 0)
-    
-    if current_revenue > 10000:
-        base_score -= 15
-    elif current_revenue > 5000:
-        base_score -= 10
-    elif current_revenue > 1000:
-        base_score -= 5
-    else:
-        base_score += 10
+    base_score += _REVENUE_DELTAS[bisect_left(_REVENUE_THRESHOLDS, get('current_revenue', 0))]
     
     # Team size indicators
-    team_size = business_data.get('team_size', 1)
-    if team_size > 20:
-        base_score -= 10
-    elif team_size > 10:
-        base_score -= 8
-    elif team_size > 5:
-        base_score -= 5
-    elif team_size < 2:
-        base_score += 15
+    base_score += _TEAM_DELTAS[bisect_left(_TEAM_THRESHOLDS, get('team_size', 1))]
     
     # Funding status
-    if business_data.get('has_funding', False):
-        funding_amount = business_data.get('funding_raised', 0)
-        if funding_amount > 1000000:
-            base_score -= 20
-        elif funding_amount > 500000:
-            base_score -= 15
-        elif funding_amount > 100000:
-            base_score -= 10
-        else:
-            base_score -= 5
+    if get('has_funding', False):
+        base_score += _FUNDING_DELTAS[bisect_left(_FUNDING_THRESHOLDS, get('funding_raised', 0))]
     
     # Cash runway
-    runway = business_data.get('runway_months', 0)
-    if runway > 18:
-        base_score -= 10
-    elif runway > 12:
-        base_score -= 5
-    elif runway < 6:
-        base_score += 15
-    elif runway < 3:
-        base_score += 25
+    base_score += _RUNWAY_DELTAS[bisect_left(_RUNWAY_THRESHOLDS, get('runway_months', 0))]
     
     # Founder experience
-    experience_impact = {
-        'Previous successful exit': -20,
-        'Serial entrepreneur': -15,
-        'Industry veteran (10+ years)': -12,
-        'First-time founder': +10
-    }
-    base_score += experience_impact.get(business_data.get('founder_experience', 'First-time founder'), 0)
+    base_score += _EXPERIENCE_IMPACT.get(get('founder_experience', 'First-time founder'), 0)
     
     # Market validation
-    if business_data.get('has_customers', False):
+    if get('has_customers', False):
         base_score -= 10
-    if business_data.get('has_revenue', False):
+    if get('has_revenue', False):
         base_score -= 8
     
     # Space size risk
-    space_size = business_data.get('space_size', 1000)
-    if space_size > 5000:
-        base_score += 8
-    elif space_size > 3000:
-        base_score += 5
-    elif space_size < 500:
-        base_score -= 3
+    base_score += _SPACE_DELTAS[bisect_left(_SPACE_THRESHOLDS, get('space_size', 1000))]
     
     final_score = max(5, min(95, base_score))
     return round(final_score, 1)
 
+def calculate_risk_score_batch(df):
+    """Score every business in a DataFrame at once, matching calculate_risk_score"""
+    import numpy as np
+    import pandas as pd
+    
+    def column(name, default):
+        if name not in df.columns:
+            return pd.Series(default, index=df.index)
+        return df[name].fillna(default)
+    
+    def numbers(name, default):
+        return column(name, default).to_numpy(dtype=float)
+    
+    def flags(name):
+        return column(name, False).astype(bool).to_numpy()
+    
+    def category(name, default, table):
+        # Unknown labels get code -1, which picks the trailing 0 delta
+        codes = pd.Index(list(table)).get_indexer(column(name, default))
+        return np.take(list(table.values()) + [0], codes)
+    
+    def band(name, default, thresholds, deltas):
+        buckets = np.searchsorted(thresholds, numbers(name, default), side='left')
+        return np.take(deltas, buckets)
+    
+    base_score = np.full(len(df), 50.0)
+    
+    # Categorical adjustments
+    base_score += category('business_type', 'Other', _BUSINESS_TYPE_RISK)
+    base_score += category('industry', 'Other', _INDUSTRY_RISK)
+    base_score += category('founder_experience', 'First-time founder', _EXPERIENCE_IMPACT)
+    
+    # Revenue, team size, funding, runway and space bands
+    base_score += band('current_revenue', 0, _REVENUE_THRESHOLDS, _REVENUE_DELTAS)
+    base_score += band('team_size', 1, _TEAM_THRESHOLDS, _TEAM_DELTAS)
+    base_score += np.where(
+        flags('has_funding'),
+        band('funding_raised', 0, _FUNDING_THRESHOLDS, _FUNDING_DELTAS),
+        0
+    )
+    base_score += band('runway_months', 0, _RUNWAY_THRESHOLDS, _RUNWAY_DELTAS)
+    base_score += band('space_size', 1000, _SPACE_THRESHOLDS, _SPACE_DELTAS)
+    
+    # Market validation
+    base_score -= 10 * flags('has_customers')
+    base_score -= 8 * flags('has_revenue')
+    
+    return np.round(np.clip(base_score, 5, 95), 1)
+
 def generate_deal_terms(business_data, risk_score):
     """Generate deal terms based on risk score"""
     base_upfront_rent = 30
@@ -253,137 +540,160 @@ def generate_deal_terms(business_data, risk_score):
         'deferred_amount': round(deferred_amount, 0),
         'annual_market_rent': round(annual_market_rent, 0),
         'revenue_trigger': round(revenue_trigger, 0),
-        'space_size': space_size
+        'space_size': space_size,
+        'risk_factors': assess_risk_factors(business_data)
     }
 
+def assess_risk_factors(business_data):
+    """List the risk factors shown in a deal's risk assessment"""
+    factors = []
+    if business_data['business_type'] == 'Restaurant':
+        factors.append("❌ High-risk industry (Restaurant)")
+    elif business_data['business_type'] in ['SaaS Startup', 'E-commerce']:
+        factors.append("✅ Scalable business model")
+    
+    if business_data.get('has_funding', False):
+        factors.append("✅ Has institutional funding")
+    else:
+        factors.append("⚠️ No institutional funding")
+    
+    if business_data.get('has_revenue', False):
+        factors.append("✅ Generating revenue")
+    else:
+        factors.append("❌ Pre-revenue stage")
+    
+    if business_data['team_size'] > 10:
+        factors.append("✅ Established team size")
+    elif business_data['team_size'] < 3:
+        factors.append("⚠️ Small team size")
+    
+    if business_data.get('founder_experience') in ['Serial entrepreneur', 'Industry veteran (10+ years)', 'Previous successful exit']:
+        factors.append("✅ Experienced founder")
+    else:
+        factors.append("⚠️ First-time founder")
+    
+    return factors
+
 # ========================================
 # DEAL GENERATOR FUNCTIONS
 # ========================================
 
-def create_deal_proposal(business_data, deal_terms):
-    """Generate a comprehensive deal proposal"""
-    projected_revenue = business_data.get('projected_revenue_12m', 0)
-    annual_revenue_share = projected_revenue * 12 * (deal_terms['revenue_share_percent'] / 100)
-    total_annual_rent = deal_terms['monthly_rent'] * 12
-    potential_total_return = total_annual_rent + annual_revenue_share
-    
-    roi_improvement = ((potential_total_return / deal_terms['annual_market_rent']) - 1) * 100 if deal_terms['annual_market_rent'] > 0 else 0
-    roi_difference = int(potential_total_return - deal_terms['annual_market_rent'])
-    
-    proposal = f"""EQUILEASE DEAL PROPOSAL
-Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}
-Proposal ID: EQL-{business_data['id'][:8].upper()}
-Valid Until: {(datetime.now() + timedelta(days=30)).strftime('%B %d, %Y')}
+_RULE = '━' * 82
+
+_PROPOSAL_TEMPLATE = """EQUILEASE DEAL PROPOSAL
+Generated: {generated}
+Proposal ID: EQL-{proposal_id}
+Valid Until: {valid_until}
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{rule}
 
 TENANT INFORMATION
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{rule}
 
-Business Name:        {business_data['business_name']}
-Business Type:        {business_data['business_type']}
-Industry:            {business_data.get('industry', 'Not specified')}
-Desired Location:     {business_data['location']}
-Space Requirements:   {business_data['space_size']:,} square feet
-Lease Duration:       {business_data.get('lease_duration', 'To be negotiated')}
+Business Name:        {business_name}
+Business Type:        {business_type}
+Industry:            {industry}
+Desired Location:     {location}
+Space Requirements:   {space_size:,} square feet
+Lease Duration:       {lease_duration}
 
-Team Size:           {business_data['team_size']} employees
-Founder Experience:   {business_data.get('founder_experience', 'Not specified')}
-Business Model:       {business_data.get('business_model', 'Not specified')}
+Team Size:           {team_size} employees
+Founder Experience:   {founder_experience}
+Business Model:       {business_model}
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{rule}
 
 FINANCIAL OVERVIEW
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{rule}
 
-Current Monthly Revenue:      ${business_data['current_revenue']:,}
-12-Month Projection:          ${business_data['projected_revenue_12m']:,}
-24-Month Projection:          ${business_data['projected_revenue_24m']:,}
-Current Burn Rate:            ${business_data.get('burn_rate', 0):,}/month
-Cash Runway:                  {business_data.get('runway_months', 0)} months
-Total Funding Raised:         ${business_data.get('funding_raised', 0):,}
+Current Monthly Revenue:      ${current_revenue:,}
+12-Month Projection:          ${projected_revenue_12m:,}
+24-Month Projection:          ${projected_revenue_24m:,}
+Current Burn Rate:            ${burn_rate:,}/month
+Cash Runway:                  {runway_months} months
+Total Funding Raised:         ${funding_raised:,}
 
-Funding Status:               {'✅ Funded' if business_data.get('has_funding') else '❌ Bootstrapped'}
-Revenue Status:               {'✅ Revenue Generating' if business_data.get('has_revenue') else '❌ Pre-Revenue'}
-Customer Base:                {'✅ Has Customers' if business_data.get('has_customers') else '❌ Pre-Customer'}
+Funding Status:               {funding_status}
+Revenue Status:               {revenue_status}
+Customer Base:                {customer_status}
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{rule}
 
 AI RISK ASSESSMENT
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{rule}
 
-Overall Risk Score:           {deal_terms['risk_score']}/100
-Risk Category:                {'🟢 LOW RISK' if deal_terms['risk_score'] < 40 else '🟡 MEDIUM RISK' if deal_terms['risk_score'] < 70 else '🔴 HIGH RISK'}
-Confidence Level:             {95 - deal_terms['risk_score'] * 0.3:.1f}%
+Overall Risk Score:           {risk_score}/100
+Risk Category:                {risk_category}
+Confidence Level:             {confidence_level:.1f}%
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{rule}
 
 PROPOSED LEASE STRUCTURE
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{rule}
 
 Market Rate Analysis:
-Standard Market Rent:         ${deal_terms['monthly_market_rent']:,.0f}/month
-Annual Market Value:          ${deal_terms['annual_market_rent']:,.0f}/year
+Standard Market Rent:         ${monthly_market_rent}/month
+Annual Market Value:          ${annual_market_rent}/year
 
 EquiLease Hybrid Structure:
 
 UPFRONT RENT COMPONENT:
-Monthly Payment:              ${deal_terms['monthly_rent']:,.0f}
-Percentage of Market:         {deal_terms['upfront_rent_percent']:.1f}%
-Annual Payment:               ${deal_terms['monthly_rent'] * 12:,.0f}
+Monthly Payment:              ${monthly_rent}
+Percentage of Market:         {upfront_rent_percent:.1f}%
+Annual Payment:               ${annual_rent}
 
 DEFERRED RENT COMPONENT:
-Monthly Deferred Amount:      ${deal_terms['deferred_amount']:,.0f}
-Percentage of Market:         {100 - deal_terms['upfront_rent_percent']:.1f}%
-Annual Deferred:              ${deal_terms['deferred_amount'] * 12:,.0f}
+Monthly Deferred Amount:      ${deferred_amount}
+Percentage of Market:         {deferred_rent_percent:.1f}%
+Annual Deferred:              ${annual_deferred}
 
-TOTAL MONTHLY SAVINGS:        ${deal_terms['deferred_amount']:,.0f}
-TOTAL ANNUAL SAVINGS:         ${deal_terms['deferred_amount'] * 12:,.0f}
+TOTAL MONTHLY SAVINGS:        ${deferred_amount}
+TOTAL ANNUAL SAVINGS:         ${annual_deferred}
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{rule}
 
 EQUITY PARTICIPATION
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{rule}
 
-Equity Stake:                 {deal_terms['equity_percent']:.1f}% of business
+Equity Stake:                 {equity_percent:.1f}% of business
 Structure:                    Convertible equity (SAFE-like instrument)
 Valuation Method:             Post-money valuation at next funding round
 Conversion Events:            Series A, acquisition, or IPO
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{rule}
 
 REVENUE SHARING AGREEMENT
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{rule}
 
-Revenue Share Percentage:     {deal_terms['revenue_share_percent']:.1f}% of gross monthly revenue
-Duration:                     {deal_terms['revenue_share_years']} years from lease commencement
-Revenue Threshold:            Activated when monthly revenue > ${deal_terms['revenue_trigger']:,}
+Revenue Share Percentage:     {revenue_share_percent:.1f}% of gross monthly revenue
+Duration:                     {revenue_share_years} years from lease commencement
+Revenue Threshold:            Activated when monthly revenue > ${revenue_trigger:,}
 Reporting Frequency:          Monthly, within 15 days of month-end
 
-Projected Annual Revenue Share: ${annual_revenue_share:,.0f}
-Total Revenue Share (Full Term): ${annual_revenue_share * deal_terms['revenue_share_years']:,.0f}
+Projected Annual Revenue Share: ${annual_revenue_share}
+Total Revenue Share (Full Term): ${total_revenue_share}
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{rule}
 
 LANDLORD RETURN ANALYSIS
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{rule}
 
 Traditional Lease Model:
-Annual Rent Income:           ${deal_terms['annual_market_rent']:,.0f}
-Total Return (Year 1):       ${deal_terms['annual_market_rent']:,.0f}
+Annual Rent Income:           ${annual_market_rent}
+Total Return (Year 1):       ${annual_market_rent}
 
 EquiLease Hybrid Model:
-Annual Rent Income:           ${deal_terms['monthly_rent'] * 12:,.0f}
-Annual Revenue Share:         ${annual_revenue_share:,.0f}
+Annual Rent Income:           ${annual_rent}
+Annual Revenue Share:         ${annual_revenue_share}
 Equity Upside:                Variable (potentially significant)
-Total Cash Return (Year 1):   ${potential_total_return:,.0f}
+Total Cash Return (Year 1):   ${potential_total_return}
 
 IMPROVEMENT OVER MARKET:      +{roi_improvement:.1f}% (+${roi_difference:,})
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{rule}
 
 NEXT STEPS
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{rule}
 
 1. Landlord Review & Approval (5-7 business days)
 2. Due Diligence Period (10 business days)
@@ -394,64 +704,169 @@ Contact Information:
 EquiLease Platform: hello@equilease.com
 Phone: (555) 123-RENT
 
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+{rule}
 
 This proposal is valid for 30 days from generation date.
 All terms subject to final due diligence and documentation.
 
 "You're not renting space. You're funding growth. You're inventing an asset class."
 """
-    
-    return proposal
 
-def create_contract_template(deal):
-    """Generate a basic contract template"""
-    contract = f"""EQUILEASE HYBRID LEASE AGREEMENT
+_CONTRACT_TEMPLATE = """EQUILEASE HYBRID LEASE AGREEMENT
 
-This Agreement is entered into on {datetime.now().strftime('%B %d, %Y')} between:
+This Agreement is entered into on {today} between:
 
 LANDLORD: [LANDLORD NAME AND ADDRESS]
-TENANT: {deal['business_name']}
+TENANT: {business_name}
 
-PREMISES: {deal['location']}
-SPACE: {deal['space_size']:,} square feet
+PREMISES: {location}
+SPACE: {space_size:,} square feet
 
 ARTICLE 1: RENT TERMS
-1.1 Base Rent: ${deal.get('monthly_rent', 0):,.0f} per month
-1.2 Market Rate: ${deal.get('monthly_market_rent', 0):,.0f} per month
-1.3 Upfront Percentage: {deal.get('upfront_rent_percent', 30):.1f}% of market rate
-1.4 Deferred Amount: ${deal.get('deferred_amount', 0):,.0f} per month
+1.1 Base Rent: ${monthly_rent} per month
+1.2 Market Rate: ${monthly_market_rent} per month
+1.3 Upfront Percentage: {upfront_rent_percent:.1f}% of market rate
+1.4 Deferred Amount: ${deferred_amount} per month
 
 ARTICLE 2: EQUITY PARTICIPATION
-2.1 Equity Percentage: {deal.get('equity_percent', 5):.1f}% of Tenant's business
+2.1 Equity Percentage: {equity_percent:.1f}% of Tenant's business
 2.2 Structure: Convertible equity instrument
 2.3 Conversion Events: Series A funding, acquisition, IPO
 
 ARTICLE 3: REVENUE SHARING
-3.1 Revenue Share: {deal.get('revenue_share_percent', 3):.1f}% of gross monthly revenue
-3.2 Duration: {deal.get('revenue_share_years', 3)} years from lease commencement
-3.3 Threshold: Activated when monthly revenue exceeds ${deal.get('revenue_trigger', 5000):,}
+3.1 Revenue Share: {revenue_share_percent:.1f}% of gross monthly revenue
+3.2 Duration: {revenue_share_years} years from lease commencement
+3.3 Threshold: Activated when monthly revenue exceeds ${revenue_trigger:,}
 
 [Additional standard commercial lease terms to be added by legal counsel]
 
 Generated by: EquiLease Platform
-Date: {datetime.now().strftime('%B %d, %Y')}
-Agreement ID: EQL-{deal['id'][:8].upper()}-CONTRACT
+Date: {today}
+Agreement ID: EQL-{agreement_id}-CONTRACT
 
 SIGNATURES:
 LANDLORD: _________________ DATE: _________
 TENANT: __________________ DATE: _________
 """
+
+def _whole_dollars(amount):
+    """Format a dollar amount with thousands separators and no cents"""
+    return f"{amount:,.0f}"
+
+def create_deal_proposal(business_data, deal_terms, now=None):
+    """Generate a comprehensive deal proposal"""
+    now = now or datetime.now()
+    risk_score = deal_terms['risk_score']
+    risk_emoji, risk_level = risk_style(risk_score)
+    monthly_rent = deal_terms['monthly_rent']
+    annual_rent = monthly_rent * 12
+    deferred_amount = deal_terms['deferred_amount']
+    upfront_rent_percent = deal_terms['upfront_rent_percent']
+    annual_market_rent = deal_terms['annual_market_rent']
+    revenue_share_percent = deal_terms['revenue_share_percent']
+    revenue_share_years = deal_terms['revenue_share_years']
     
-    return contract
+    projected_revenue = business_data.get('projected_revenue_12m', 0)
+    annual_revenue_share = projected_revenue * 12 * (revenue_share_percent / 100)
+    potential_total_return = annual_rent + annual_revenue_share
+    
+    roi_improvement = ((potential_total_return / annual_market_rent) - 1) * 100 if annual_market_rent > 0 else 0
+    roi_difference = int(potential_total_return - annual_market_rent)
+    
+    return _PROPOSAL_TEMPLATE.format_map({
+        'rule': _RULE,
+        'generated': now.strftime('%B %d, %Y at %I:%M %p'),
+        'proposal_id': business_data['id'][:8].upper(),
+        'valid_until': (now + timedelta(days=30)).strftime('%B %d, %Y'),
+        
+        'business_name': business_data['business_name'],
+        'business_type': business_data['business_type'],
+        'industry': business_data.get('industry', 'Not specified'),
+        'location': business_data['location'],
+        'space_size': business_data['space_size'],
+        'lease_duration': business_data.get('lease_duration', 'To be negotiated'),
+        'team_size': business_data['team_size'],
+        'founder_experience': business_data.get('founder_experience', 'Not specified'),
+        'business_model': business_data.get('business_model', 'Not specified'),
+        
+        'current_revenue': business_data['current_revenue'],
+        'projected_revenue_12m': business_data['projected_revenue_12m'],
+        'projected_revenue_24m': business_data['projected_revenue_24m'],
+        'burn_rate': business_data.get('burn_rate', 0),
+        'runway_months': business_data.get('runway_months', 0),
+        'funding_raised': business_data.get('funding_raised', 0),
+        'funding_status': '✅ Funded' if business_data.get('has_funding') else '❌ Bootstrapped',
+        'revenue_status': '✅ Revenue Generating' if business_data.get('has_revenue') else '❌ Pre-Revenue',
+        'customer_status': '✅ Has Customers' if business_data.get('has_customers') else '❌ Pre-Customer',
+        
+        'risk_score': risk_score,
+        'risk_category': f"{risk_emoji} {risk_level.upper()} RISK",
+        'confidence_level': 95 - risk_score * 0.3,
+        
+        'monthly_market_rent': _whole_dollars(deal_terms['monthly_market_rent']),
+        'annual_market_rent': _whole_dollars(annual_market_rent),
+        'monthly_rent': _whole_dollars(monthly_rent),
+        'upfront_rent_percent': upfront_rent_percent,
+        'annual_rent': _whole_dollars(annual_rent),
+        'deferred_amount': _whole_dollars(deferred_amount),
+        'deferred_rent_percent': 100 - upfront_rent_percent,
+        'annual_deferred': _whole_dollars(deferred_amount * 12),
+        'equity_percent': deal_terms['equity_percent'],
+        'revenue_share_percent': revenue_share_percent,
+        'revenue_share_years': revenue_share_years,
+        'revenue_trigger': deal_terms['revenue_trigger'],
+        
+        'annual_revenue_share': _whole_dollars(annual_revenue_share),
+        'total_revenue_share': _whole_dollars(annual_revenue_share * revenue_share_years),
+        'potential_total_return': _whole_dollars(potential_total_return),
+        'roi_improvement': roi_improvement,
+        'roi_difference': roi_difference
+    })
+
+def create_contract_template(deal, now=None):
+    """Generate a basic contract template"""
+    now = now or datetime.now()
+    return _CONTRACT_TEMPLATE.format_map({
+        'today': now.strftime('%B %d, %Y'),
+        'business_name': deal['business_name'],
+        'location': deal['location'],
+        'space_size': deal['space_size'],
+        'monthly_rent': _whole_dollars(deal.get('monthly_rent', 0)),
+        'monthly_market_rent': _whole_dollars(deal.get('monthly_market_rent', 0)),
+        'upfront_rent_percent': deal.get('upfront_rent_percent', 30),
+        'deferred_amount': _whole_dollars(deal.get('deferred_amount', 0)),
+        'equity_percent': deal.get('equity_percent', 5),
+        'revenue_share_percent': deal.get('revenue_share_percent', 3),
+        'revenue_share_years': deal.get('revenue_share_years', 3),
+        'revenue_trigger': deal.get('revenue_trigger', 5000),
+        'agreement_id': deal['id'][:8].upper()
+    })
+
+# Deal fields the contract reads; the cache keys on these and the date
+_CONTRACT_FIELDS = (
+    'id', 'business_name', 'location', 'space_size', 'monthly_rent',
+    'monthly_market_rent', 'upfront_rent_percent', 'deferred_amount',
+    'equity_percent', 'revenue_share_percent', 'revenue_share_years',
+    'revenue_trigger'
+)
+
+def get_contract(deal):
+    """Contract text for a deal, generated once per set of terms and day"""
+    contract_inputs = tuple((field, deal[field]) for field in _CONTRACT_FIELDS if field in deal)
+    return _cached_contract(contract_inputs, datetime.now().date())
+
+@lru_cache(maxsize=256)
+def _cached_contract(contract_inputs, day):
+    return create_contract_template(dict(contract_inputs), datetime.combine(day, datetime.min.time()))
 
 # ========================================
 # STREAMLIT UI FUNCTIONS
 # ========================================
 
-def load_css():
-    """Load custom CSS styling"""
-    st.markdown("""
+# Injected on every rerun: Streamlit drops any element a rerun does not
+# re-emit, so skipping it would unstyle the page. Whitespace is collapsed
+# once here to keep the per-rerun message small.
+_CSS = re.sub(r'\s+', ' ', """
     <style>
     .main-header {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
@@ -519,7 +934,37 @@ def load_css():
         box-shadow: 0 4px 12px rgba(102, 126, 234, 0.3);
     }
     </style>
-    """, unsafe_allow_html=True)
+""").strip()
+
+def load_css():
+    """Load custom CSS styling"""
+    st.markdown(_CSS, unsafe_allow_html=True)
+
+# Button callbacks run before the rerun a click triggers, so that rerun
+# already renders the new state and no extra st.rerun() pass is needed
+
+def _go_to(page):
+    """Switch to another page"""
+    st.session_state.page = page
+
+def _set_deal_status(deal_id, new_status, message):
+    """Update a deal's status and confirm it with a toast"""
+    update_deal_status(deal_id, new_status)
+    st.toast(message)
+
+def _apply_deal_action(deal_id):
+    """Run the action picked on a deal card"""
+    action = st.session_state.get(f"action_{deal_id}")
+    if action == "Approve":
+        _set_deal_status(deal_id, 'approved', "Deal approved!")
+        # Back to the placeholder so the applied action can't be re-run by accident
+        st.session_state[f"action_{deal_id}"] = "—"
+    elif action == "Reject":
+        _set_deal_status(deal_id, 'rejected', "Deal rejected")
+        st.session_state[f"action_{deal_id}"] = "—"
+    elif action == "Details":
+        st.session_state.selected_deal_id = deal_id
+        _go_to('deal_details')
 
 def show_home():
     """Landing page with value proposition"""
@@ -542,9 +987,7 @@ def show_home():
         - **Faster approval than traditional leases**
         """)
         
-        if st.button("Apply as Business", key="business_btn"):
-            st.session_state.page = 'tenant'
-            st.rerun()
+        st.button("Apply as Business", key="business_btn", on_click=_go_to, args=('tenant',))
     
     with col2:
         st.markdown("""
@@ -555,9 +998,7 @@ def show_home():
         - **Revenue share from growing businesses**
         """)
         
-        if st.button("View Landlord Dashboard", key="landlord_btn"):
-            st.session_state.page = 'landlord'
-            st.rerun()
+        st.button("View Landlord Dashboard", key="landlord_btn", on_click=_go_to, args=('landlord',))
     
     # Key metrics
     st.markdown("### 📊 Platform Metrics")
@@ -577,77 +1018,85 @@ def show_tenant_form():
     st.title("🚀 Business Application")
     st.markdown("Complete the form below to get AI-powered lease terms tailored to your business")
     
-    with st.container():
-        st.subheader("📋 Business Information")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            business_name = st.text_input("Business Name *", placeholder="e.g., TechStart Solutions")
-            business_type = st.selectbox(
-                "Business Type *",
-                ["SaaS Startup", "E-commerce", "Restaurant", "Retail Store", "Franchise", "Professional Services", "Manufacturing", "Other"]
-            )
-            industry = st.selectbox(
-                "Industry *",
-                ["Technology", "Food & Beverage", "Retail", "Healthcare", "Finance", "Education", "Real Estate", "Other"]
-            )
+    # Widgets inside the form only send their values on submit, so editing
+    # a field no longer reruns the whole script
+    with st.form("tenant_app", clear_on_submit=False):
+        with st.container():
+            st.subheader("📋 Business Information")
             
-        with col2:
-            location = st.text_input("Desired Location *", placeholder="e.g., Manhattan, NY")
-            space_size = st.number_input("Space Size (sq ft) *", min_value=100, max_value=50000, value=1500)
-            lease_duration = st.selectbox("Preferred Lease Duration", ["1 year", "2 years", "3 years", "5 years"])
-    
-    with st.container():
-        st.subheader("💰 Financial Information")
-        
-        col1, col2 = st.columns(2)
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                business_name = st.text_input("Business Name *", placeholder="e.g., TechStart Solutions")
+                business_type = st.selectbox(
+                    "Business Type *",
+                    ["SaaS Startup", "E-commerce", "Restaurant", "Retail Store", "Franchise", "Professional Services", "Manufacturing", "Other"]
+                )
+                industry = st.selectbox(
+                    "Industry *",
+                    ["Technology", "Food & Beverage", "Retail", "Healthcare", "Finance", "Education", "Real Estate", "Other"]
+                )
+                
+            with col2:
+                location = st.text_input("Desired Location *", placeholder="e.g., Manhattan, NY")
+                space_size = st.number_input("Space Size (sq ft) *", min_value=100, max_value=50000, value=1500)
+                lease_duration = st.selectbox("Preferred Lease Duration", ["1 year", "2 years", "3 years", "5 years"])
         
-        with col1:
-            current_revenue = st.number_input("Current Monthly Revenue ($)", min_value=0, value=0, step=1000)
-            projected_revenue_12m = st.number_input("Projected Revenue (12 months) ($)", min_value=0, value=10000, step=1000)
-            projected_revenue_24m = st.number_input("Projected Revenue (24 months) ($)", min_value=0, value=20000, step=1000)
+        with st.container():
+            st.subheader("💰 Financial Information")
             
-        with col2:
-            burn_rate = st.number_input("Monthly Burn Rate ($)", min_value=0, value=5000, step=500)
-            runway_months = st.number_input("Cash Runway (months)", min_value=0, value=12, step=1)
-            funding_raised = st.number_input("Total Funding Raised ($)", min_value=0, value=0, step=10000)
-    
-    with st.container():
-        st.subheader("👥 Team & Experience")
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                current_revenue = st.number_input("Current Monthly Revenue ($)", min_value=0, value=0, step=1000)
+                projected_revenue_12m = st.number_input("Projected Revenue (12 months) ($)", min_value=0, value=10000, step=1000)
+                projected_revenue_24m = st.number_input("Projected Revenue (24 months) ($)", min_value=0, value=20000, step=1000)
+                
+            with col2:
+                burn_rate = st.number_input("Monthly Burn Rate ($)", min_value=0, value=5000, step=500)
+                runway_months = st.number_input("Cash Runway (months)", min_value=0, value=12, step=1)
+                funding_raised = st.number_input("Total Funding Raised ($)", min_value=0, value=0, step=10000)
         
-        col1, col2 = st.columns(2)
+        with st.container():
+            st.subheader("👥 Team & Experience")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                team_size = st.number_input("Current Team Size", min_value=1, max_value=500, value=5)
+                founder_experience = st.selectbox(
+                    "Founder Experience",
+                    ["First-time founder", "Serial entrepreneur", "Industry veteran (10+ years)", "Previous successful exit"]
+                )
+                
+            with col2:
+                has_funding = st.checkbox("Have you raised institutional funding?")
+                has_revenue = st.checkbox("Currently generating revenue?")
+                has_customers = st.checkbox("Do you have paying customers?")
         
-        with col1:
-            team_size = st.number_input("Current Team Size", min_value=1, max_value=500, value=5)
-            founder_experience = st.selectbox(
-                "Founder Experience",
-                ["First-time founder", "Serial entrepreneur", "Industry veteran (10+ years)", "Previous successful exit"]
+        with st.container():
+            st.subheader("📝 Business Details")
+            
+            business_model = st.selectbox(
+                "Business Model",
+                ["B2B SaaS", "B2C SaaS", "E-commerce", "Marketplace", "Brick & Mortar", "Franchise", "Service-based", "Other"]
             )
             
-        with col2:
-            has_funding = st.checkbox("Have you raised institutional funding?")
-            has_revenue = st.checkbox("Currently generating revenue?")
-            has_customers = st.checkbox("Do you have paying customers?")
-    
-    with st.container():
-        st.subheader("📝 Business Details")
+            target_market = st.text_area("Target Market Description", placeholder="Describe your target customers...")
+            competitive_advantage = st.text_area("Competitive Advantage", placeholder="What makes your business unique?...")
+            growth_strategy = st.text_area("Growth Strategy", placeholder="How do you plan to scale?...")
         
-        business_model = st.selectbox(
-            "Business Model",
-            ["B2B SaaS", "B2C SaaS", "E-commerce", "Marketplace", "Brick & Mortar", "Franchise", "Service-based", "Other"]
-        )
-        
-        target_market = st.text_area("Target Market Description", placeholder="Describe your target customers...")
-        competitive_advantage = st.text_area("Competitive Advantage", placeholder="What makes your business unique?...")
-        growth_strategy = st.text_area("Growth Strategy", placeholder="How do you plan to scale?...")
+        # Form submission
+        submitted = st.form_submit_button("🎯 Calculate My Deal Terms", type="primary")
     
-    # Form submission
-    if st.button("🎯 Calculate My Deal Terms", type="primary"):
+    if submitted:
         if not business_name or not business_type or not location:
             st.error("Please fill in all required fields marked with *")
             return
         
+        # One clock read for the whole submission
+        now = datetime.now()
+        
         # Create business data dictionary
         business_data = {
             'id': str(uuid.uuid4()),
@@ -672,7 +1121,7 @@ def show_tenant_form():
             'target_market': target_market,
             'competitive_advantage': competitive_advantage,
             'growth_strategy': growth_strategy,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'status': 'pending'
         }
         
@@ -680,10 +1129,10 @@ def show_tenant_form():
         with st.spinner("🤖 AI is analyzing your business..."):
             risk_score = calculate_risk_score(business_data)
             deal_terms = generate_deal_terms(business_data, risk_score)
-            proposal = create_deal_proposal(business_data, deal_terms)
+            proposal = create_deal_proposal(business_data, deal_terms, now)
             
             # Save deal
-            save_deal(business_data, deal_terms, proposal)
+            save_deal(business_data, deal_terms, proposal, now)
         
         # Show results
         show_deal_results(business_data, deal_terms, proposal)
@@ -696,7 +1145,7 @@ def show_deal_results(business_data, deal_terms, proposal):
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        risk_color = "🟢" if deal_terms['risk_score'] < 40 else "🟡" if deal_terms['risk_score'] < 70 else "🔴"
+        risk_color, _ = risk_style(deal_terms['risk_score'])
         st.metric("Risk Score", f"{risk_color} {deal_terms['risk_score']}/100")
     
     with col2:
@@ -762,8 +1211,8 @@ def show_landlord_dashboard():
         st.markdown("3. Generate contracts and track performance")
         return
     
-    # Convert to DataFrame for easier manipulation
-    df = pd.DataFrame(deals)
+    # Columnar view shared across reruns; never mutate it in place
+    df = get_deals_df()
     
     # Dashboard metrics
     show_dashboard_metrics(df)
@@ -782,6 +1231,7 @@ def show_landlord_dashboard():
 
 def show_dashboard_metrics(df):
     """Show key dashboard metrics"""
+    status_counts = df['status'].value_counts()
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
@@ -789,11 +1239,11 @@ def show_dashboard_metrics(df):
         st.metric("Total Applications", total_deals)
     
     with col2:
-        pending_deals = len(df[df['status'] == 'pending'])
+        pending_deals = int(status_counts.get('pending', 0))
         st.metric("Pending Review", pending_deals)
     
     with col3:
-        approved_deals = len(df[df['status'] == 'approved'])
+        approved_deals = int(status_counts.get('approved', 0))
         approval_rate = (approved_deals / total_deals * 100) if total_deals > 0 else 0
         st.metric("Approval Rate", f"{approval_rate:.1f}%")
     
@@ -803,47 +1253,68 @@ def show_dashboard_metrics(df):
 
 def show_filter_section(df):
     """Show filtering options"""
+    options = _filter_options(deals_version())
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        status_filter = st.selectbox("Status", ["All"] + df['status'].unique().tolist())
+        status_filter = st.selectbox("Status", ["All"] + options['status'])
     
     with col2:
-        business_type_filter = st.selectbox("Business Type", ["All"] + df['business_type'].unique().tolist())
+        business_type_filter = st.selectbox("Business Type", ["All"] + options['business_type'])
     
     with col3:
-        location_filter = st.selectbox("Location", ["All"] + df['location'].unique().tolist())
+        location_filter = st.selectbox("Location", ["All"] + options['location'])
     
     with col4:
-        risk_filter = st.selectbox("Risk Level", ["All", "Low (0-40)", "Medium (41-70)", "High (71-100)"])
+        risk_filter = st.selectbox("Risk Level", ["All"] + list(_RISK_RANGE_LABELS.values()))
     
-    # Apply filters
-    filtered_df = filter_deals(df, status_filter, business_type_filter, location_filter, risk_filter)
+    # Apply filters (memoized per deals version and filter selection)
+    filtered_df = _filtered_deals(deals_version(), status_filter, business_type_filter, location_filter, risk_filter)
     return filtered_df
 
+@st.cache_data(max_entries=1, show_spinner=False)
+def _filter_options(version):
+    """Sorted distinct values for each filter dropdown"""
+    import pandas as pd
+    
+    df = get_deals_df()
+    return {
+        column: sorted(pd.unique(df[column].dropna()))
+        for column in ('status', 'business_type', 'location')
+    }
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _filtered_deals(version, status_filter, business_type_filter, location_filter, risk_filter):
+    return filter_deals(get_deals_df(), status_filter, business_type_filter, location_filter, risk_filter)
+
 def filter_deals(df, status_filter, business_type_filter, location_filter, risk_filter):
     """Apply filters to deals DataFrame"""
-    filtered_df = df.copy()
+    conditions = []
     
     if status_filter != "All":
-        filtered_df = filtered_df[filtered_df['status'] == status_filter]
+        conditions.append(df['status'] == status_filter)
     
     if business_type_filter != "All":
-        filtered_df = filtered_df[filtered_df['business_type'] == business_type_filter]
+        conditions.append(df['business_type'] == business_type_filter)
     
     if location_filter != "All":
-        filtered_df = filtered_df[filtered_df['location'] == location_filter]
+        conditions.append(df['location'] == location_filter)
     
     if risk_filter != "All":
-        risk_ranges = {
-            "Low (0-40)": (0, 40),
-            "Medium (41-70)": (41, 70),
-            "High (71-100)": (71, 100)
-        }
-        min_risk, max_risk = risk_ranges[risk_filter]
-        filtered_df = filtered_df[(filtered_df['risk_score'] >= min_risk) & (filtered_df['risk_score'] <= max_risk)]
+        risk_levels = {label: level for level, label in _RISK_RANGE_LABELS.items()}
+        conditions.append(df['risk_bucket'] == risk_levels[risk_filter])
     
-    return filtered_df
+    if not conditions:
+        return df  # unfiltered: the shared frame itself, read-only
+    
+    # Combine into one mask so only a single filtered frame is materialized
+    mask = conditions[0]
+    for condition in conditions[1:]:
+        mask &= condition
+    return df[mask]
+
+# Deal cards rendered per page of the management list
+_DEAL_PAGE_SIZES = (10, 25, 50)
 
 def show_deal_management(filtered_df):
     """Show deal management interface"""
@@ -851,86 +1322,99 @@ def show_deal_management(filtered_df):
         st.info("No deals match your current filters.")
         return
     
-    st.write(f"Showing {len(filtered_df)} deals")
+    total = len(filtered_df)
+    page_size = _DEAL_PAGE_SIZES[0]
+    page = 1
+    
+    if total > page_size:
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            page_size = st.selectbox("Deals per page", _DEAL_PAGE_SIZES, key='deal_page_size')
+        
+        page_count = -(-total // page_size)
+        # A narrower filter or larger page size can leave the stored page out of range
+        if st.session_state.get('deal_page', 1) > page_count:
+            st.session_state.deal_page = page_count
+        
+        with col2:
+            page = st.number_input("Page", min_value=1, max_value=page_count, step=1, key='deal_page')
+    
+    start = (page - 1) * page_size
+    page_df = filtered_df.iloc[start:start + page_size]
+    st.write(f"Showing {start + 1}-{start + len(page_df)} of {total} deals")
     
     # Deal cards
-    for idx, deal in filtered_df.iterrows():
+    for deal in page_df.itertuples(index=False, name='Deal'):
         show_deal_card(deal)
 
+_DEAL_CARD_ACTIONS = ("—", "Approve", "Reject", "Details")
+
+_DEAL_CARD_TEMPLATE = """<div style="border: 1px solid #e0e0e0; border-radius: 8px; padding: 1rem; margin: 1rem 0; background: white;">
+    <h4>{risk_emoji} {business_name} - {business_type}</h4>
+    <p><strong>Location:</strong> {location} | <strong>Space:</strong> {space_size:,} sq ft</p>
+    <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem;">
+        <div>
+            <strong>Business Details:</strong>
+            <ul>
+                <li>Type: {business_type}</li>
+                <li>Industry: {industry}</li>
+                <li>Team Size: {team_size} people</li>
+                <li>Current Revenue: ${current_revenue:,}/month</li>
+                <li>Projected (12m): ${projected_revenue_12m:,}/month</li>
+            </ul>
+        </div>
+        <div>
+            <strong>Deal Terms:</strong>
+            <ul>
+                <li>Risk Score: {risk_score:g}/100 ({risk_bucket})</li>
+                <li>Upfront Rent: {upfront_rent_percent:.1f}%</li>
+                <li>Monthly Payment: ${monthly_rent:,}</li>
+                <li>Equity: {equity_percent:.1f}%</li>
+                <li>Revenue Share: {revenue_share_percent:.1f}%</li>
+            </ul>
+        </div>
+        <div>
+            <strong>Financial Info:</strong>
+            <ul>
+                <li>Funding Raised: ${funding_raised:,}</li>
+                <li>Burn Rate: ${burn_rate:,}/month</li>
+                <li>Runway: {runway_months} months</li>
+                <li>Has Revenue: {has_revenue_text}</li>
+            </ul>
+        </div>
+    </div>
+</div>"""
+
 def show_deal_card(deal):
     """Display individual deal card"""
-    risk_score = deal.get('risk_score', 50)
-    risk_emoji = "🟢" if risk_score < 40 else "🟡" if risk_score < 70 else "🔴"
-    risk_label = "Low" if risk_score < 40 else "Medium" if risk_score < 70 else "High"
-    
     with st.container():
-        st.markdown(f"""
-        <div style="border: 1px solid #e0e0e0; border-radius: 8px; padding: 1rem; margin: 1rem 0; background: white;">
-            <h4>{risk_emoji} {deal['business_name']} - {deal['business_type']}</h4>
-            <p><strong>Location:</strong> {deal['location']} | <strong>Space:</strong> {deal['space_size']:,} sq ft</p>
-        </div>
-        """, unsafe_allow_html=True)
+        # Static card content goes out as one markdown element; only the
+        # action widgets below need their own elements
+        card_fields = deal._asdict()
+        card_fields['has_revenue_text'] = 'Yes' if deal.has_revenue else 'No'
+        st.markdown(_DEAL_CARD_TEMPLATE.format_map(card_fields), unsafe_allow_html=True)
         
-        col1, col2, col3 = st.columns(3)
+        # Actions: one picker and one Apply button instead of a button per action
+        col1, col2, col3 = st.columns([2, 1, 1])
         
         with col1:
-            st.markdown(f"""
-            **Business Details:**
-            - Type: {deal['business_type']}
-            - Industry: {deal.get('industry', 'N/A')}
-            - Team Size: {deal['team_size']} people
-            - Current Revenue: ${deal['current_revenue']:,}/month
-            - Projected (12m): ${deal['projected_revenue_12m']:,}/month
-            """)
-        
-        with col2:
-            st.markdown(f"""
-            **Deal Terms:**
-            - Risk Score: {risk_score}/100 ({risk_label})
-            - Upfront Rent: {deal.get('upfront_rent_percent', 30):.1f}%
-            - Monthly Payment: ${deal.get('monthly_rent', 0):,}
-            - Equity: {deal.get('equity_percent', 5):.1f}%
-            - Revenue Share: {deal.get('revenue_share_percent', 3):.1f}%
-            """)
-        
-        with col3:
-            st.markdown(f"""
-            **Financial Info:**
-            - Funding Raised: ${deal.get('funding_raised', 0):,}
-            - Burn Rate: ${deal.get('burn_rate', 0):,}/month
-            - Runway: {deal.get('runway_months', 0)} months
-            - Has Revenue: {'Yes' if deal.get('has_revenue', False) else 'No'}
-            """)
-        
-        # Action buttons
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            if st.button(f"✅ Approve", key=f"approve_{deal['id']}"):
-                update_deal_status(deal['id'], 'approved')
-                st.success("Deal approved!")
-                st.rerun()
+            st.selectbox(
+                "Action", _DEAL_CARD_ACTIONS,
+                key=f"action_{deal.id}", label_visibility="collapsed"
+            )
         
         with col2:
-            if st.button(f"❌ Reject", key=f"reject_{deal['id']}"):
-                update_deal_status(deal['id'], 'rejected')
-                st.error("Deal rejected")
-                st.rerun()
+            st.button("Apply", key=f"apply_{deal.id}", on_click=_apply_deal_action, args=(deal.id,))
         
         with col3:
-            if st.button(f"📋 Details", key=f"details_{deal['id']}"):
-                st.session_state.selected_deal_id = deal['id']
-                st.session_state.page = 'deal_details'
-                st.rerun()
-        
-        with col4:
-            contract = create_contract_template(deal)
+            contract = get_contract(deal._asdict())
             st.download_button(
                 label="📄 Contract",
                 data=contract,
-                file_name=f"contract_{deal['business_name']}.txt",
+                file_name=f"contract_{deal.business_name}.txt",
                 mime="text/plain",
-                key=f"download_{deal['id']}"
+                key=f"download_{deal.id}"
             )
 
 def show_portfolio_analytics(df):
@@ -940,61 +1424,26 @@ def show_portfolio_analytics(df):
         return
     
     if PLOTLY_AVAILABLE:
+        version = deals_version()
         col1, col2 = st.columns(2)
         
         with col1:
-            # Risk distribution
-            risk_distribution = df['risk_score'].apply(
-                lambda x: 'Low (0-40)' if x < 40 else 'Medium (41-70)' if x < 70 else 'High (71-100)'
-            ).value_counts()
-            
-            fig_risk = px.pie(
-                values=risk_distribution.values,
-                names=risk_distribution.index,
-                title="Risk Distribution",
-                color_discrete_map={
-                    'Low (0-40)': '#00cc96',
-                    'Medium (41-70)': '#ffa500',
-                    'High (71-100)': '#ff6b6b'
-                }
-            )
-            st.plotly_chart(fig_risk, use_container_width=True)
+            st.plotly_chart(_risk_pie(version), use_container_width=True)
         
         with col2:
-            # Business type distribution
-            business_type_dist = df['business_type'].value_counts()
-            
-            fig_business = px.bar(
-                x=business_type_dist.index,
-                y=business_type_dist.values,
-                title="Applications by Business Type",
-                labels={'x': 'Business Type', 'y': 'Number of Applications'}
-            )
-            st.plotly_chart(fig_business, use_container_width=True)
+            st.plotly_chart(_business_type_bar(version), use_container_width=True)
         
         # Revenue projections
         if 'projected_revenue_12m' in df.columns:
-            fig_revenue = px.scatter(
-                df,
-                x='risk_score',
-                y='projected_revenue_12m',
-                color='business_type',
-                size='team_size',
-                hover_data=['business_name'],
-                title="Risk Score vs. Projected Revenue",
-                labels={'risk_score': 'Risk Score', 'projected_revenue_12m': 'Projected Revenue (12m)'}
-            )
-            st.plotly_chart(fig_revenue, use_container_width=True)
+            st.plotly_chart(_revenue_scatter(version), use_container_width=True)
     else:
         # Simple analytics without plotly
         col1, col2 = st.columns(2)
         
         with col1:
             st.markdown("**Risk Distribution:**")
-            risk_counts = df['risk_score'].apply(
-                lambda x: 'Low' if x < 40 else 'Medium' if x < 70 else 'High'
-            ).value_counts()
-            for risk_level, count in risk_counts.items():
+            risk_counts = df['risk_bucket'].value_counts()
+            for risk_level, count in risk_counts[risk_counts > 0].items():
                 st.write(f"- {risk_level}: {count} deals")
         
         with col2:
@@ -1003,6 +1452,68 @@ def show_portfolio_analytics(df):
             for btype, count in type_counts.items():
                 st.write(f"- {btype}: {count} deals")
 
+@lru_cache(maxsize=None)
+def _plotly_express():
+    """plotly.express, imported the first time a chart is drawn"""
+    import plotly.express as px
+    return px
+
+# Portfolio figures are built once per deals version and shared across reruns
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _risk_pie(version):
+    risk_distribution = _deals_df(version)['risk_bucket'].value_counts()
+    risk_distribution = risk_distribution[risk_distribution > 0]
+    
+    return _plotly_express().pie(
+        values=risk_distribution.values,
+        names=[_RISK_RANGE_LABELS[level] for level in risk_distribution.index],
+        title="Risk Distribution",
+        color_discrete_map={
+            _RISK_RANGE_LABELS['Low']: '#00cc96',
+            _RISK_RANGE_LABELS['Medium']: '#ffa500',
+            _RISK_RANGE_LABELS['High']: '#ff6b6b'
+        }
+    )
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _business_type_bar(version):
+    business_type_dist = _deals_df(version)['business_type'].value_counts()
+    
+    return _plotly_express().bar(
+        x=business_type_dist.index,
+        y=business_type_dist.values,
+        title="Applications by Business Type",
+        labels={'x': 'Business Type', 'y': 'Number of Applications'}
+    )
+
+# Larger portfolios are sampled down to roughly this many scatter points
+_SCATTER_MAX_POINTS = 500
+
+def _scatter_sample(df):
+    """Sample rows per business type, in proportion, keeping each type visible"""
+    if len(df) <= _SCATTER_MAX_POINTS:
+        return df
+    
+    # A fixed seed keeps the same points across rebuilds of the figure
+    shuffled = df.sample(frac=1, random_state=0)
+    groups = shuffled.groupby('business_type', observed=True, dropna=False)
+    quota = (groups['business_type'].transform('size') * _SCATTER_MAX_POINTS // len(df)).clip(lower=1)
+    return shuffled[groups.cumcount() < quota]
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _revenue_scatter(version):
+    return _plotly_express().scatter(
+        _scatter_sample(_deals_df(version)),
+        x='risk_score',
+        y='projected_revenue_12m',
+        color='business_type',
+        size='team_size',
+        hover_data=['business_name'],
+        title="Risk Score vs. Projected Revenue",
+        labels={'risk_score': 'Risk Score', 'projected_revenue_12m': 'Projected Revenue (12m)'}
+    )
+
 def show_deal_details():
     """Show detailed view of a specific deal"""
     if 'selected_deal_id' not in st.session_state:
@@ -1018,9 +1529,7 @@ def show_deal_details():
     st.title(f"📋 Deal Details: {deal['business_name']}")
     
     # Back button
-    if st.button("← Back to Dashboard"):
-        st.session_state.page = 'landlord'
-        st.rerun()
+    st.button("← Back to Dashboard", on_click=_go_to, args=('landlord',))
     
     # Deal overview
     show_deal_overview(deal)
@@ -1034,42 +1543,51 @@ def show_deal_details():
     # Actions
     show_deal_actions(deal)
 
+_OVERVIEW_BASIC_TEMPLATE = """**Basic Information:**
+- **Business Name:** {business_name}
+- **Type:** {business_type}
+- **Industry:** {industry}
+- **Location:** {location}
+- **Space Size:** {space_size:,} sq ft
+- **Lease Duration:** {lease_duration}"""
+
+_OVERVIEW_TEAM_TEMPLATE = """**Team & Experience:**
+- **Team Size:** {team_size} people
+- **Founder Experience:** {founder_experience}
+- **Has Funding:** {has_funding_text}
+- **Has Revenue:** {has_revenue_text}
+- **Has Customers:** {has_customers_text}"""
+
+_OVERVIEW_DESCRIPTIONS = (
+    ('target_market', "Target Market"),
+    ('competitive_advantage', "Competitive Advantage"),
+    ('growth_strategy', "Growth Strategy")
+)
+
 def show_deal_overview(deal):
     """Show deal overview section"""
     st.subheader("🏢 Business Overview")
     
+    overview_fields = {'industry': 'N/A', 'lease_duration': 'N/A', 'founder_experience': 'N/A'}
+    overview_fields.update(deal)
+    for flag in ('has_funding', 'has_revenue', 'has_customers'):
+        overview_fields[flag + '_text'] = 'Yes' if deal.get(flag, False) else 'No'
+    
     col1, col2 = st.columns(2)
     
     with col1:
-        st.markdown(f"""
-        **Basic Information:**
-        - **Business Name:** {deal['business_name']}
-        - **Type:** {deal['business_type']}
-        - **Industry:** {deal.get('industry', 'N/A')}
-        - **Location:** {deal['location']}
-        - **Space Size:** {deal['space_size']:,} sq ft
-        - **Lease Duration:** {deal.get('lease_duration', 'N/A')}
-        """)
+        st.markdown(_OVERVIEW_BASIC_TEMPLATE.format_map(overview_fields))
     
     with col2:
-        st.markdown(f"""
-        **Team & Experience:**
-        - **Team Size:** {deal['team_size']} people
-        - **Founder Experience:** {deal.get('founder_experience', 'N/A')}
-        - **Has Funding:** {'Yes' if deal.get('has_funding', False) else 'No'}
-        - **Has Revenue:** {'Yes' if deal.get('has_revenue', False) else 'No'}
-        - **Has Customers:** {'Yes' if deal.get('has_customers', False) else 'No'}
-        """)
+        st.markdown(_OVERVIEW_TEAM_TEMPLATE.format_map(overview_fields))
     
     # Business description
-    if deal.get('target_market'):
-        st.markdown(f"**Target Market:** {deal['target_market']}")
-    
-    if deal.get('competitive_advantage'):
-        st.markdown(f"**Competitive Advantage:** {deal['competitive_advantage']}")
-    
-    if deal.get('growth_strategy'):
-        st.markdown(f"**Growth Strategy:** {deal['growth_strategy']}")
+    descriptions = [
+        f"**{label}:** {deal[field]}"
+        for field, label in _OVERVIEW_DESCRIPTIONS if deal.get(field)
+    ]
+    if descriptions:
+        st.markdown("\n\n".join(descriptions))
 
 def show_financial_projections(deal):
     """Show financial projections section"""
@@ -1097,13 +1615,23 @@ def show_financial_projections(deal):
     with col3:
         st.metric("Funding Raised", f"${deal.get('funding_raised', 0):,}")
 
+_PROPOSED_TERMS_TEMPLATE = """**Proposed Terms:**
+
+• Upfront Rent: {upfront_rent_percent:.1f}%
+
+• Monthly Payment: ${monthly_rent:,}
+
+• Equity Stake: {equity_percent:.1f}%
+
+• Revenue Share: {revenue_share_percent:.1f}% for {revenue_share_years} years"""
+
 def show_risk_assessment(deal):
     """Show AI risk assessment breakdown"""
     st.subheader("🤖 AI Risk Assessment")
     
     risk_score = deal.get('risk_score', 50)
-    risk_color = "🟢" if risk_score < 40 else "🟡" if risk_score < 70 else "🔴"
-    risk_label = "Low Risk" if risk_score < 40 else "Medium Risk" if risk_score < 70 else "High Risk"
+    risk_color, risk_level = risk_style(risk_score)
+    risk_label = f"{risk_level} Risk"
     
     col1, col2 = st.columns(2)
     
@@ -1111,44 +1639,23 @@ def show_risk_assessment(deal):
         st.metric("Overall Risk Score", f"{risk_color} {risk_score}/100", risk_label)
         
         # Deal terms
-        st.markdown("**Proposed Terms:**")
-        st.write(f"• Upfront Rent: {deal.get('upfront_rent_percent', 30):.1f}%")
-        st.write(f"• Monthly Payment: ${deal.get('monthly_rent', 0):,}")
-        st.write(f"• Equity Stake: {deal.get('equity_percent', 5):.1f}%")
-        st.write(f"• Revenue Share: {deal.get('revenue_share_percent', 3):.1f}% for {deal.get('revenue_share_years', 3)} years")
+        terms_fields = {
+            'upfront_rent_percent': 30, 'monthly_rent': 0, 'equity_percent': 5,
+            'revenue_share_percent': 3, 'revenue_share_years': 3
+        }
+        terms_fields.update(deal)
+        st.markdown(_PROPOSED_TERMS_TEMPLATE.format_map(terms_fields))
     
     with col2:
         # Risk factors breakdown
         st.markdown("**Risk Factors Analysis:**")
         
-        factors = []
-        if deal['business_type'] == 'Restaurant':
-            factors.append("❌ High-risk industry (Restaurant)")
-        elif deal['business_type'] in ['SaaS Startup', 'E-commerce']:
-            factors.append("✅ Scalable business model")
-        
-        if deal.get('has_funding', False):
-            factors.append("✅ Has institutional funding")
-        else:
-            factors.append("⚠️ No institutional funding")
-        
-        if deal.get('has_revenue', False):
-            factors.append("✅ Generating revenue")
-        else:
-            factors.append("❌ Pre-revenue stage")
-        
-        if deal['team_size'] > 10:
-            factors.append("✅ Established team size")
-        elif deal['team_size'] < 3:
-            factors.append("⚠️ Small team size")
-        
-        if deal.get('founder_experience') in ['Serial entrepreneur', 'Industry veteran (10+ years)', 'Previous successful exit']:
-            factors.append("✅ Experienced founder")
-        else:
-            factors.append("⚠️ First-time founder")
+        # Stored with the deal when it was scored; older records predate that
+        factors = deal.get('risk_factors')
+        if factors is None:
+            factors = assess_risk_factors(deal)
         
-        for factor in factors:
-            st.write(factor)
+        st.markdown("\n\n".join(factors))
 
 def show_deal_actions(deal):
     """Show available actions for the deal"""
@@ -1157,23 +1664,20 @@ def show_deal_actions(deal):
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        if st.button("✅ Approve Deal", type="primary"):
-            update_deal_status(deal['id'], 'approved')
-            st.success("Deal approved successfully!")
-            st.rerun()
+        st.button(
+            "✅ Approve Deal", type="primary",
+            on_click=_set_deal_status, args=(deal['id'], 'approved', "Deal approved successfully!")
+        )
     
     with col2:
-        if st.button("❌ Reject Deal"):
-            update_deal_status(deal['id'], 'rejected')
-            st.error("Deal rejected")
-            st.rerun()
+        st.button("❌ Reject Deal", on_click=_set_deal_status, args=(deal['id'], 'rejected', "Deal rejected"))
     
     with col3:
         if st.button("📝 Request Modifications"):
             st.info("Modification request sent to tenant")
     
     with col4:
-        contract = create_contract_template(deal)
+        contract = get_contract(deal)
         st.download_button(
             label="📄 Generate Contract",
             data=contract,
@@ -1194,7 +1698,7 @@ def show_deal_actions(deal):
 def main():
     """Main application router"""
     # Initialize database
-    initialize_database()
+    _database_ready()
     
     # Load custom CSS
     load_css()
@@ -1222,16 +1726,15 @@ def main():
         
         st.markdown("---")
         st.markdown("### 📊 Quick Stats")
-        deals = get_deals()
-        st.metric("Total Deals", len(deals))
-        if deals:
-            pending = len([d for d in deals if d.get('status') == 'pending'])
-            st.metric("Pending", pending)
+        total_deals, pending_deals = deal_counts()
+        st.metric("Total Deals", total_deals)
+        if total_deals:
+            st.metric("Pending", pending_deals)
         
         st.markdown("---")
         st.markdown("### 🛠️ System Info")
         st.write(f"Plotly: {'✅ Available' if PLOTLY_AVAILABLE else '❌ Not installed'}")
-        st.write(f"Data: {len(deals)} deals stored")
+        st.write(f"Data: {total_deals} deals stored")
     
     # Route to appropriate page
     if st.session_state.page == 'home':